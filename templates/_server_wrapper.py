@@ -1,40 +1,84 @@
 """Minimal Battlesnake server wrapper for local testing.
 Used internally by `snake-arena test`.
 Usage: python _server_wrapper.py <strategy.py> [port]
+
+If the strategy also defines decide_move_delta(prev, data), it is called
+instead of decide_move with the previous /move state of the game (None on
+the first turn), so it can update its own state incrementally.
 """
 
 import importlib.util
-import json
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from hashlib import blake2b
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+try:
+    from orjson import dumps, loads
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    import json
+
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
 
 
 class H(BaseHTTPRequestHandler):
     fn = None
+    delta_fn = None
+    prev = None
+    INFO_BYTES = b'{"apiversion":"1"}'
+    OK_BYTES = b'{"ok":true}'
+    MOVE_BYTES = {m: dumps({"move": m}) for m in ("up", "down", "left", "right")}
+    # Moves already decided, keyed by a hash of the raw /move body, so
+    # replayed or retried requests skip decide_move (FIFO, bounded)
+    CACHE_SIZE = 512
+    cache = {}
+    cache_lock = threading.Lock()
 
     def do_GET(self):
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps({"apiversion": "1"}).encode())
+        self.wfile.write(self.INFO_BYTES)
 
     def do_POST(self):
         length = int(self.headers.get("Content-Length", 0))
-        body = json.loads(self.rfile.read(length)) if length else {}
+        raw = self.rfile.read(length) if length else b""
         if self.path == "/move":
-            try:
-                move = self.__class__.fn(body)
-                if move not in ("up", "down", "left", "right"):
+            key = blake2b(raw, digest_size=16).digest()
+            move = self.cache.get(key)
+            if move is None:
+                body = loads(raw) if raw else {}
+                cls = self.__class__
+                try:
+                    if cls.delta_fn is not None:
+                        prev, cls.prev = cls.prev, body
+                        move = cls.delta_fn(prev, body)
+                    else:
+                        move = cls.fn(body)
+                    if move not in self.MOVE_BYTES:
+                        move = "up"
+                    self.remember(key, move)
+                except Exception:
                     move = "up"
-            except Exception:
-                move = "up"
-            resp = {"move": move}
+            resp = self.MOVE_BYTES[move]
         else:
-            resp = {"ok": True}
+            if self.path in ("/start", "/end"):
+                self.__class__.prev = None
+            resp = self.OK_BYTES
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps(resp).encode())
+        self.wfile.write(resp)
+
+    @classmethod
+    def remember(cls, key, move):
+        with cls.cache_lock:
+            if len(cls.cache) >= cls.CACHE_SIZE:
+                del cls.cache[next(iter(cls.cache))]
+            cls.cache[key] = move
 
     def log_message(self, format, *args):
         pass
@@ -44,7 +88,8 @@ spec = importlib.util.spec_from_file_location("s", sys.argv[1])
 mod = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(mod)
 H.fn = mod.decide_move
+H.delta_fn = getattr(mod, "decide_move_delta", None)
 port = int(sys.argv[2]) if len(sys.argv) > 2 else 8080
-server = HTTPServer(("0.0.0.0", port), H)
+server = ThreadingHTTPServer(("0.0.0.0", port), H)
 print(f"Snake server on port {port}", flush=True)
 server.serve_forever()
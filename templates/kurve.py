@@ -13,6 +13,13 @@ other trails means elimination. Last player alive wins.
 Random gaps appear in trails every ~70-100 ticks.
 """
 
+import math
+
+# cos/sin for every whole-degree heading. Turns are ±5°, so a whole-degree
+# heading stays whole and the lookahead can index these instead of calling trig.
+_COS = [math.cos(math.radians(d)) for d in range(360)]
+_SIN = [math.sin(math.radians(d)) for d in range(360)]
+
 
 def decide_move(data: dict) -> str:
     """Choose your next move based on the current game state.
@@ -27,7 +34,6 @@ def decide_move(data: dict) -> str:
     Returns:
         One of: "left", "right", "straight"
     """
-    import math
     import random
 
     board = data.get("board", {})
@@ -49,18 +55,23 @@ def decide_move(data: dict) -> str:
     width = board.get("width", 640)
     height = board.get("height", 480)
 
+    # Whole-degree headings can use the lookup tables
+    whole = direction == int(direction)
+
     # Look ahead: where will we be in N ticks for each move?
     def simulate(move, steps=15):
         x, y = pos["x"], pos["y"]
-        d = direction
+        d = int(direction) % 360 if whole else direction
+        turn = 5 if move == "left" else -5 if move == "right" else 0
         for _ in range(steps):
-            if move == "left":
-                d = (d + 5) % 360
-            elif move == "right":
-                d = (d - 5) % 360
-            rad = math.radians(d)
-            x += math.cos(rad) * speed
-            y += math.sin(rad) * speed
+            d = (d + turn) % 360
+            if whole:
+                x += _COS[d] * speed
+                y += _SIN[d] * speed
+            else:
+                rad = math.radians(d)
+                x += math.cos(rad) * speed
+                y += math.sin(rad) * speed
         return x, y
 
     # Score each move: prefer staying away from walls
@@ -5,12 +5,12 @@ import random
 
 def decide_move(data: dict) -> str:
     head = data["you"]["head"]
-    body_set = set()
+    w, h = data["board"]["width"], data["board"]["height"]
+    occupied = bytearray(w * h)
     for snake in data["board"]["snakes"]:
         for seg in snake["body"]:
-            body_set.add((seg["x"], seg["y"]))
+            occupied[seg["y"] * w + seg["x"]] = 1
 
-    w, h = data["board"]["width"], data["board"]["height"]
     moves = {
         "up":    (head["x"], head["y"] + 1),
         "down":  (head["x"], head["y"] - 1),
@@ -20,7 +20,7 @@ def decide_move(data: dict) -> str:
 
     safe = []
     for move, (x, y) in moves.items():
-        if 0 <= x < w and 0 <= y < h and (x, y) not in body_set:
+        if 0 <= x < w and 0 <= y < h and not occupied[y * w + x]:
             safe.append(move)
 
-    return random.choice(safe) if safe else "up"
+    return safe[random.randrange(len(safe))] if safe else "up"
@@ -5,7 +5,39 @@ This template includes flood fill for space analysis and smarter
 food/opponent handling. Customize it to build a competitive snake.
 """
 
-from collections import deque
+from array import array
+
+# Neighbour offsets: up, down, right, left
+_DIRS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def flood_fill(occ: bytearray, start_x: int, start_y: int, w: int, h: int,
+               seen: bytearray = None, label: int = 1) -> int:
+    """Count cells reachable from (start_x, start_y) through free cells of occ.
+
+    Reached cells are marked with label in seen, so callers can tell which
+    region a later cell belongs to without filling again.
+    """
+    if seen is None:
+        seen = bytearray(w * h)
+    # Each cell is queued at most once, so a flat int buffer of w * h cells
+    # works as the BFS queue; cells are encoded as y * w + x
+    queue = array("i", [0]) * (w * h)
+    queue[0] = start_y * w + start_x
+    seen[queue[0]] = label
+    head, tail = 0, 1
+    while head < tail:
+        cy, cx = divmod(queue[head], w)
+        head += 1
+        for dx, dy in _DIRS:
+            nx, ny = cx + dx, cy + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                i = ny * w + nx
+                if not occ[i] and not seen[i]:
+                    seen[i] = label
+                    queue[tail] = i
+                    tail += 1
+    return tail
 
 
 def decide_move(data: dict) -> str:
@@ -19,14 +51,15 @@ def decide_move(data: dict) -> str:
     snakes = board["snakes"]
     my_id = data["you"]["id"]
 
-    # Build occupied set (exclude tail tips since they'll move)
-    occupied = set()
+    # Build occupancy grid, one byte per cell indexed y * w + x
+    # (exclude tail tips since they'll move)
+    occ = bytearray(w * h)
     for snake in snakes:
         for i, seg in enumerate(snake["body"]):
             # Tail tip will move unless snake just ate
             if i == len(snake["body"]) - 1 and snake["body"][-1] != snake["body"][-2]:
                 continue
-            occupied.add((seg["x"], seg["y"]))
+            occ[seg["y"] * w + seg["x"]] = 1
 
     # Possible moves
     moves = {
@@ -39,7 +72,7 @@ def decide_move(data: dict) -> str:
     # Filter safe moves
     safe = {}
     for move, (x, y) in moves.items():
-        if 0 <= x < w and 0 <= y < h and (x, y) not in occupied:
+        if 0 <= x < w and 0 <= y < h and not occ[y * w + x]:
             safe[move] = (x, y)
 
     if not safe:
@@ -47,23 +80,34 @@ def decide_move(data: dict) -> str:
     if len(safe) == 1:
         return list(safe.keys())[0]
 
-    # Flood fill: count reachable cells from each safe move
-    def flood_fill(start_x, start_y):
-        visited = set()
-        queue = deque([(start_x, start_y)])
-        visited.add((start_x, start_y))
-        while queue:
-            cx, cy = queue.popleft()
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in occupied and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
-        return len(visited)
+    # Flood fill: count reachable cells from each safe move. Moves that land
+    # in an already-filled region reuse its size instead of filling again.
+    seen = bytearray(w * h)
+    region_sizes = [0]
+    space_by_move = {}
+    for move, (x, y) in safe.items():
+        label = seen[y * w + x]
+        if not label:
+            label = len(region_sizes)
+            region_sizes.append(flood_fill(occ, x, y, w, h, seen, label))
+        space_by_move[move] = region_sizes[label]
+
+    # Only one move leaves room for our body: no need to score the rest
+    survivable = [m for m, space in space_by_move.items() if space >= length]
+    if len(survivable) == 1:
+        return survivable[0]
+
+    # Heads of opponents at least as long as us, gathered once for all moves
+    threats = [
+        (snake["head"]["x"], snake["head"]["y"])
+        for snake in snakes
+        if snake["id"] != my_id and snake["length"] >= length
+    ]
 
     move_scores = {}
-    for move, (x, y) in safe.items():
-        space = flood_fill(x, y)
+    for move in survivable or safe:
+        x, y = safe[move]
+        space = space_by_move[move]
         # Penalize moves that lead to small spaces
         if space < length:
             score = -100 + space
@@ -76,12 +120,8 @@ def decide_move(data: dict) -> str:
             score += max(0, 20 - closest_food_dist) * 2
 
         # Avoid head-to-head with longer snakes
-        for snake in snakes:
-            if snake["id"] == my_id:
-                continue
-            opp_head = snake["head"]
-            dist = abs(x - opp_head["x"]) + abs(y - opp_head["y"])
-            if dist <= 1 and snake["length"] >= length:
+        for ox, oy in threats:
+            if abs(x - ox) + abs(y - oy) <= 1:
                 score -= 50
 
         # Prefer center of board
@@ -29,11 +29,11 @@ def decide_move(data: dict) -> str:
     board = data["board"]
     w, h = board["width"], board["height"]
 
-    # Collect all occupied cells
-    occupied = set()
+    # Mark all occupied cells, one byte per cell indexed y * w + x
+    occupied = bytearray(w * h)
     for snake in board["snakes"]:
         for seg in snake["body"]:
-            occupied.add((seg["x"], seg["y"]))
+            occupied[seg["y"] * w + seg["x"]] = 1
 
     # Possible moves and their resulting positions
     moves = {
@@ -46,7 +46,7 @@ def decide_move(data: dict) -> str:
     # Filter for safe moves (in bounds + not occupied)
     safe = []
     for move, (x, y) in moves.items():
-        if 0 <= x < w and 0 <= y < h and (x, y) not in occupied:
+        if 0 <= x < w and 0 <= y < h and not occupied[y * w + x]:
             safe.append(move)
 
     if not safe:
@@ -60,4 +60,4 @@ def decide_move(data: dict) -> str:
     #   - Control space in the center of the board
 
     import random
-    return random.choice(safe)
+    return safe[random.randrange(len(safe))]